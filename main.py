@@ -4,15 +4,142 @@ import logging
 import argparse
 import os
 import sys
-import csv
-import datetime # Added for timestamp
-from src.simulator import Simulator
-from src.utils import setup_logging
+import hashlib # For keying the config cache on file content
+from src.utils import setup_logging, unpack_lineup
+# csv, datetime, multiprocessing and src.simulator are imported where they are
+# used so that --help and argument errors don't pay for them up front
 
 CONFIG_FILE = os.path.join("data", "config.yaml")
 RESULTS_BASE_DIR = "results" # Consistent base directory
+SCORE_FD_ENV = "SCORE_FD" # If set, the non-verbose score goes to this fd as a little-endian double
+CSV_BUFFER_SIZE = 1 << 20 # 1 MiB write buffer so appends reach the OS in one write
 
-def main():
+logger = logging.getLogger(__name__)
+
+def load_simulator(config_path):
+    """
+    Returns a Simulator for config_path, reusing a pickled copy when one exists
+    for the current config content (data/.config.<md5>.pkl). Falls back to
+    parsing the YAML and writes the cache for the next run.
+    """
+    from src.simulator import Simulator
+
+    with open(config_path, 'rb') as f:
+        config_hash = hashlib.md5(f.read()).hexdigest()
+    cache_path = os.path.join(os.path.dirname(config_path), f".config.{config_hash}.pkl")
+
+    try:
+        return Simulator.from_cached(cache_path)
+    except FileNotFoundError:
+        pass # First run with this config; build and cache it below
+    except Exception as e:
+        logger.info("Ignoring configuration cache %s: %s", cache_path, e)
+
+    simulator = Simulator(config_path=config_path)
+    simulator.save_cache(cache_path)
+    return simulator
+
+def read_lineups_file(path):
+    """Reads one whitespace-separated lineup per line, skipping blank lines."""
+    with open(path, 'r') as f:
+        return [line.split() for line in f if line.strip()]
+
+# Per-process state shared by run_simulation() and the pool workers (see init_worker)
+_process_simulator = None
+_worker_num_games = None
+_worker_player_ids = None # Roster order used to decode packed lineups
+
+def run_simulation(lineup, num_games=None):
+    """
+    Simulates num_games (config default if None) for one lineup without YAML
+    logging and returns the average score. The Simulator is loaded on first
+    use and reused by later calls in the same process.
+    """
+    global _process_simulator
+    if _process_simulator is None:
+        _process_simulator = load_simulator(CONFIG_FILE)
+    _process_simulator.run_simulations(lineup_ids=lineup, verbose=False, num_games_override=num_games)
+    return _process_simulator.get_average_score()
+
+def init_worker(config_path, num_games, player_ids=None):
+    """
+    Pool initializer: keeps one Simulator per worker for every lineup it runs.
+    Forked workers inherit the parent's Simulator; spawned ones load their own.
+    player_ids is the roster order that packed lineups index into (see run_one_packed).
+    """
+    global _process_simulator, _worker_num_games, _worker_player_ids
+    if _process_simulator is None:
+        _process_simulator = load_simulator(config_path)
+    _worker_num_games = num_games
+    _worker_player_ids = player_ids
+
+def run_one_lineup(lineup):
+    """Pool task: simulates one lineup with the worker's game count, returning (lineup, avg_score)."""
+    return lineup, run_simulation(lineup, _worker_num_games)
+
+def run_one_packed(packed):
+    """Pool task: like run_one_lineup, but for a lineup packed with src.utils.pack_lineup."""
+    return packed, run_simulation(unpack_lineup(packed, _worker_player_ids), _worker_num_games)
+
+def run_daemon(simulator, num_games, stdin=sys.stdin, stdout=sys.stdout):
+    """
+    Daemon mode: reads one lineup (9 space-separated player IDs) per line from
+    stdin and answers each with one line holding its average score, flushing
+    after every answer so a parent process can pipeline requests. Returns at EOF.
+    """
+    global _process_simulator
+    _process_simulator = simulator
+    for line in stdin:
+        lineup = line.split()
+        if not lineup:
+            continue
+        stdout.write("%r\n" % run_simulation(lineup, num_games))
+        stdout.flush()
+
+def run_lineups_batch(simulator, lineups, num_games, csv_path, cores=None):
+    """
+    Simulates every lineup and appends one row (Player1..Player9, AvgScore) per
+    lineup to csv_path. With more than one core, lineups are spread over a
+    multiprocessing.Pool and rows are written in completion order.
+    """
+    import csv
+    import multiprocessing
+    global _process_simulator
+    cores = cores or os.cpu_count() or 1
+    cores = min(cores, len(lineups)) or 1
+
+    with open(csv_path, 'a', newline='', buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        pool = None
+        if cores == 1:
+            _process_simulator = simulator
+            init_worker(CONFIG_FILE, num_games)
+            results = map(run_one_lineup, lineups)
+        else:
+            logger.info("Running batch on %d worker processes.", cores)
+            _process_simulator = simulator # Shared with forked workers copy-on-write
+            chunksize = max(1, len(lineups) // (4 * cores))
+            pool = multiprocessing.Pool(processes=cores, initializer=init_worker,
+                                        initargs=(CONFIG_FILE, num_games))
+            results = pool.imap_unordered(run_one_lineup, lineups, chunksize=chunksize)
+        log_each = logger.isEnabledFor(logging.INFO) # Checked once, not per lineup
+        def rows():
+            # One flat tuple per lineup; the score is formatted exactly once
+            for i, (lineup, avg_score) in enumerate(results):
+                score_str = "%.4f" % avg_score
+                if log_each:
+                    logger.info("Batch lineup %d/%d: %s -> %s", i + 1, len(lineups), ' '.join(lineup), score_str)
+                yield (*lineup, score_str)
+        try:
+            writer.writerows(rows()) # Single call; rows still stream as results arrive
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+    logger.info("Appended %d batch results to %s", len(lineups), csv_path)
+
+def build_parser():
+    """Builds the full argparse parser (used whenever _fast_parse declines)."""
     parser = argparse.ArgumentParser(description="Baseball Game Simulator")
     # Make --lineup optional, default to None
     parser.add_argument('--lineup', required=False, nargs='+', default=None,
@@ -28,24 +155,77 @@ def main():
                         help='Show detailed play-by-play logs from the game simulation on stderr.')
     parser.add_argument('--save-yaml', action='store_true',
                         help='Force saving the detailed YAML log file, even when using --csv.')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Write the detailed results as JSON Lines (.jsonl) instead of YAML; much faster for large verbose runs.')
     parser.add_argument('--output-dir', type=str, default=None,
                         help='Specify the output directory for results (used internally by orchestrator).')
     parser.add_argument('--num-games', type=int, default=None,
                         help='Override the number of games to simulate per lineup (from config.yaml).')
+    parser.add_argument('--lineups-file', type=str, default=None,
+                        help='Batch mode: text file with one lineup (9 player IDs) per line. Requires --csv; all results are appended to it.')
+    parser.add_argument('--cores', type=int, default=None,
+                        help='Number of worker processes. Batch mode: spread lineups (default: all CPUs). Single non-verbose lineup: spread its games (default: 1; 0 = all CPUs).')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Daemon mode: read lineups (9 IDs per line) from stdin until EOF and print one average score per line.')
+    return parser
+
+# Option defaults for _fast_parse; must match build_parser()
+_ARG_DEFAULTS = {
+    'lineup': None, 'csv': None, 'verbose': None, 'debug': False,
+    'show_game_logs': False, 'save_yaml': False, 'jsonl': False, 'output_dir': None,
+    'num_games': None, 'lineups_file': None, 'cores': None, 'daemon': False,
+}
+# Single-value options _fast_parse understands: flag -> (attribute, converter)
+_FAST_OPTIONS = {
+    '--csv': ('csv', str),
+    '--verbose': ('verbose', str),
+    '--output-dir': ('output_dir', str),
+    '--num-games': ('num_games', int),
+    '--lineups-file': ('lineups_file', str),
+    '--cores': ('cores', int),
+}
 
-    args = parser.parse_args()
+def _fast_parse(argv):
+    """
+    Hand-rolled parse of the plain option shapes the orchestrator passes
+    (--lineup IDs..., --lineups-file, --csv, --verbose, --output-dir, --num-games, --cores).
+    Returns None for anything else, including --help and malformed values,
+    so argparse handles it and reports errors as usual.
+    """
+    args = argparse.Namespace(**_ARG_DEFAULTS)
+    i, n = 0, len(argv)
+    while i < n:
+        opt = argv[i]
+        if opt == '--lineup':
+            j = i + 1
+            while j < n and not argv[j].startswith('-'):
+                j += 1
+            if j == i + 1:
+                return None
+            args.lineup = argv[i + 1:j]
+            i = j
+            continue
+        spec = _FAST_OPTIONS.get(opt)
+        if spec is None or i + 1 >= n or argv[i + 1].startswith('-'):
+            return None
+        try:
+            setattr(args, spec[0], spec[1](argv[i + 1]))
+        except ValueError:
+            return None
+        i += 2
+    return args
+
+def main():
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
+    if args.lineups_file and not args.csv:
+        build_parser().error("--lineups-file requires --csv.")
 
     # --- Determine Output Directory ---
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S") # Timestamp for potential filenames
-    if args.output_dir:
-        # Use the directory provided by the orchestrator
-        run_output_dir = args.output_dir
-        # Ensure the orchestrator-provided directory exists (it should, but safety check)
-        os.makedirs(run_output_dir, exist_ok=True)
-    else:
-        # Direct run: Use the base results directory
-        run_output_dir = RESULTS_BASE_DIR
-        os.makedirs(run_output_dir, exist_ok=True) # Ensure base results directory exists
+    # Orchestrator-provided directory, or the base results directory for direct runs
+    run_output_dir = args.output_dir or RESULTS_BASE_DIR
+    os.makedirs(run_output_dir, exist_ok=True) # The only directory check for this run
 
     # Determine verbosity more robustly
     if args.csv:
@@ -63,16 +243,19 @@ def main():
          # This covers cases where --verbose is None or --verbose is 'True'/'true'/etc.
          verbose_mode = True
 
+    # Timestamp for the YAML filename, only needed when YAML may be saved
+    timestamp = None
+    if (args.save_yaml or verbose_mode) and not args.lineups_file:
+        import datetime
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+
     # Setup logging - Default level is WARNING (from utils)
     # Set root logger level based on --debug
     root_log_level = logging.DEBUG if args.debug else logging.WARNING
     setup_logging(level=root_log_level) # Setup root logger
 
-    # Get the main logger for this script
-    logger = logging.getLogger(__name__)
-
     # Log directory info now that logger is available
-    logger.info(f"Using output directory: {run_output_dir}")
+    logger.info("Using output directory: %s", run_output_dir)
 
     # Specifically set game logger level if requested
     if args.show_game_logs:
@@ -83,66 +266,96 @@ def main():
 
 
     logger.info("Baseball Simulator Run Initializing...") # This will only show if root level is INFO/DEBUG
-    logger.debug(f"Command line args: {args}")
+    logger.debug("Command line args: %s", args)
 
     try:
         # Instantiate Simulator first, as we might need it for the default lineup
-        simulator = Simulator(config_path=CONFIG_FILE)
+        simulator = load_simulator(CONFIG_FILE)
+
+        # --- Daemon Mode: lineups streamed over stdin/stdout until EOF ---
+        if args.daemon:
+            logger.info("Daemon mode: reading lineups from stdin")
+            run_daemon(simulator, args.num_games)
+            return
+
+        # --- Batch Mode: many lineups in this one process ---
+        if args.lineups_file:
+            lineups = read_lineups_file(args.lineups_file)
+            logger.info("Batch mode: %d lineups from %s", len(lineups), args.lineups_file)
+            run_lineups_batch(simulator, lineups, args.num_games,
+                              os.path.join(run_output_dir, args.csv), cores=args.cores)
+            logger.info("Baseball Simulator Batch Run Finished.")
+            return
 
         # Determine the lineup to use
         if args.lineup:
             lineup_to_use = args.lineup
-            logger.info(f"Using lineup order from command line arguments: {' '.join(lineup_to_use)}")
+            logger.info("Using lineup order from command line arguments: %s", " ".join(lineup_to_use))
         else:
             logger.info("No --lineup argument provided. Using default order from config.yaml.")
             try:
                 lineup_to_use = simulator.get_default_lineup_ids()
-                logger.info(f"Default lineup order: {' '.join(lineup_to_use)}")
+                logger.info("Default lineup order: %s", " ".join(lineup_to_use))
             except Exception as e:
-                 logger.error(f"Failed to get default lineup from config: {e}")
+                 logger.error("Failed to get default lineup from config: %s", e)
                  sys.exit(1) # Exit if default lineup cannot be determined
 
 
-        logger.info(f"Verbose Logging: {verbose_mode}")
+        logger.info("Verbose Logging: %s", verbose_mode)
         if args.csv:
-            logger.info(f"CSV Output Path: {args.csv}")
+            logger.info("CSV Output Path: %s", args.csv)
 
         # Run simulations for the determined lineup
         # The validate_lineup method inside run_simulations will check the final lineup_to_use
         # Pass the calculated verbose_mode and potential num_games override
         # Note: verbose_mode now primarily controls the *default* YAML saving behavior
+        # Determine if YAML should be saved
+        # Save YAML if explicitly requested OR if running verbosely by default (not csv, not --verbose False)
+        save_yaml_output = args.save_yaml or verbose_mode
+        # --jsonl results are streamed to disk while the games run instead of being kept for a YAML dump
+        jsonl_path = None
+        if save_yaml_output and args.jsonl:
+            jsonl_path = os.path.join(run_output_dir, f"simulation_results_{timestamp}.jsonl")
+
         simulator.run_simulations(
             lineup_ids=lineup_to_use,
             verbose=verbose_mode,
-            num_games_override=args.num_games # Pass the override value
+            num_games_override=args.num_games, # Pass the override value
+            processes=args.cores, # Only non-verbose runs use a game pool
+            jsonl_path=jsonl_path
         )
 
         # --- Handle Output ---
         avg_score = simulator.get_average_score()
 
-        # Determine if YAML should be saved
-        # Save YAML if explicitly requested OR if running verbosely by default (not csv, not --verbose False)
-        save_yaml_output = args.save_yaml or verbose_mode
         # Determine if score should be printed to stdout (for orchestrator)
         # Print score ONLY if YAML is NOT being saved by default (i.e., csv mode or --verbose False)
         # AND YAML wasn't explicitly forced with --save-yaml
         print_score_to_stdout = not verbose_mode and not args.save_yaml
 
         # --- Save YAML ---
-        if save_yaml_output:
+        if jsonl_path:
+            logger.info("Results were written to JSONL file: %s", jsonl_path)
+        elif save_yaml_output:
             # Generate timestamped YAML filename
             yaml_filename = f"simulation_results_{timestamp}.yaml"
             yaml_path = os.path.join(run_output_dir, yaml_filename)
-            logger.info(f"Saving results to YAML file: {yaml_path}") # Use INFO level
+            logger.info("Saving results to YAML file: %s", yaml_path) # Use INFO level
             # Pass directory and filename to simulator method (needs update)
             simulator.save_results_yaml(output_path=yaml_path) # Pass full path
 
         # --- Print Score to Stdout (for Orchestrator) ---
-        if print_score_to_stdout:
+        score_fd = os.environ.get(SCORE_FD_ENV)
+        if print_score_to_stdout and score_fd:
+            # Orchestrator --subprocess passes a pipe: send the raw double, no text round-trip
+            import struct
+            os.write(int(score_fd), struct.pack('<d', avg_score))
+            logger.debug("Wrote average score to fd %s: %.4f", score_fd, avg_score)
+        elif print_score_to_stdout:
             # Print average score to stdout for potential orchestrator capture
             print(f"{avg_score:.4f}", end='')
             # Log score printing only at DEBUG level to avoid noise when orchestrator runs
-            logger.debug(f"Printed average score to stdout: {avg_score:.4f}")
+            logger.debug("Printed average score to stdout: %.4f", avg_score)
 
 
         # --- Append Score to CSV ---
@@ -150,39 +363,34 @@ def main():
             # Use the determined run_output_dir (results/ for direct, results/timestamp/ for orchestrator)
             csv_filename = args.csv # Keep the user-provided filename part
             csv_path = os.path.join(run_output_dir, csv_filename)
-            logger.info(f"Attempting to append score to CSV: {csv_path}") # This will only show if root level is INFO/DEBUG
-            try:
-                file_exists = os.path.isfile(csv_path)
-                # Ensure directory exists (redundant if created above, but safe)
+            if os.path.dirname(csv_filename): # Only a --csv with its own subdirectory needs another check
                 os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-                with open(csv_path, 'a', newline='') as f:
+            logger.info("Attempting to append score to CSV: %s", csv_path) # This will only show if root level is INFO/DEBUG
+            import csv
+            try:
+                with open(csv_path, 'a', newline='', buffering=CSV_BUFFER_SIZE) as f:
                     writer = csv.writer(f)
-                    # Add header if file is new and we are appending directly
-                    # Note: If run via orchestrator, header should be handled there.
-                    # This header logic is mainly for direct main.py runs with --csv.
-                    # if not file_exists:
-                    #     header = [f"P{i+1}_ID" for i in range(9)] + ["AverageScore"]
-                    #     writer.writerow(header)
+                    # No header here: the orchestrator writes it before running batches
 
                     # Format: Player1, Player2, ..., Player9, AvgScore
-                    row = list(lineup_to_use) + [f"{avg_score:.4f}"]
+                    row = (*lineup_to_use, "%.4f" % avg_score)
                     writer.writerow(row)
-                    logger.info(f"Appended average score to {csv_path}") # This will only show if root level is INFO/DEBUG
+                    logger.info("Appended average score to %s", csv_path) # This will only show if root level is INFO/DEBUG
             except IOError as e:
-                logger.error(f"Failed to append score to CSV {csv_path}: {e}")
+                logger.error("Failed to append score to CSV %s: %s", csv_path, e)
 
 
         logger.info("Baseball Simulator Run Finished.")
 
     except FileNotFoundError:
-        logger.error(f"Fatal Error: Cannot find configuration file at {CONFIG_FILE}. Exiting.")
+        logger.error("Fatal Error: Cannot find configuration file at %s. Exiting.", CONFIG_FILE)
         sys.exit(1)
     except ValueError as e:
          # Catch errors from Simulator init, get_default_lineup_ids, or validate_lineup
-         logger.error(f"Fatal Error: Configuration, Lineup, or Validation error - {e}. Exiting.")
+         logger.error("Fatal Error: Configuration, Lineup, or Validation error - %s. Exiting.", e)
          sys.exit(1)
     except Exception as e:
-        logger.exception(f"An unexpected fatal error occurred during simulation run: {e}") # Log traceback
+        logger.exception("An unexpected fatal error occurred during simulation run: %s", e) # Log traceback
         sys.exit(1)
 
 if __name__ == "__main__":
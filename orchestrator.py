@@ -1,6 +1,8 @@
 # orchestrator.py
 
 import itertools
+import collections
+import multiprocessing
 import subprocess
 import yaml
 import os
@@ -9,20 +11,64 @@ import csv
 import logging
 import datetime
 import argparse
-from math import factorial
-import pandas as pd # Added for reading/sorting CSV
-from src.utils import setup_logging
+import heapq
+import struct
+import gc
+import signal
+import selectors
+import random
+import statistics
+from math import factorial, sqrt
+from src.utils import setup_logging, pack_lineup, unpack_lineup
+from main import CSV_BUFFER_SIZE, SCORE_FD_ENV, init_worker, load_simulator, run_one_packed
+
+# Prefer the libyaml C parser, as src/simulator.py does; fall back to the pure-Python loader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 CONFIG_FILE = os.path.join("data", "config.yaml")
 RESULTS_BASE_DIR = "results"
+# Interpreter for --subprocess/--daemon children; defaults to the one running the orchestrator
+# (so e.g. `pypy3 orchestrator.py` uses PyPy throughout unless this says otherwise)
+CHILD_PYTHON = os.environ.get("LINEUPSIM_CHILD_PYTHON", sys.executable)
+# Constant head of the --subprocess command line; the lineup IDs follow it
+SUBPROCESS_CMD_PREFIX = (CHILD_PYTHON, 'main.py', '--lineup')
+DAEMON_PIPELINE_DEPTH = 2 # Lineups queued per --daemon process, so it never idles waiting on the parent
+PROGRESS_EVERY = 1000 # Lineups between INFO progress lines (per-lineup results log at DEBUG)
+# Pool chunking: ~32 chunks per worker keeps the tail balanced, the cap bounds IPC messages
+POOL_CHUNKS_PER_WORKER = 32
+POOL_MAX_CHUNKSIZE = 1024
+CSV_BATCH_ROWS = 1000 # Rows buffered before each batch write and flush()
+WORKER_NICE_INCREMENT = 5 # --pin-workers: worker priority below the orchestrator's
+# Fast-path row text for 9 IDs + score, byte-identical to csv.writer's output (\r\n terminator)
+CSV_ROW_FORMAT = ",".join(["%s"] * 9) + ",%.4f\r\n"
+CSV_SPECIAL_CHARS = ',"\r\n' # IDs containing any of these need csv.writer's quoting
+
+# Parsed YAML by (path, st_mtime_ns, st_size): an edited file is re-parsed on next use
+_YAML_CACHE = {}
+
+def _load_yaml(path):
+    """
+    Parses a YAML file, memoized until the file's mtime or size changes.
+    Callers share the returned object, so it must be treated as read-only.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        _YAML_CACHE[key] = data
+    return data
 
 def load_config_and_players(config_path):
     """Loads main config, orchestrator params, and player IDs."""
     logger = logging.getLogger("Orchestrator")
     logger.info(f"Loading main configuration from: {config_path}")
     try:
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yaml(config_path)
 
         player_file_path = config_data.get('player_data_file')
         if not player_file_path:
@@ -32,17 +78,22 @@ def load_config_and_players(config_path):
         orch_params = config_data.get('orchestrator_params', {}) # Load orchestrator params
 
         logger.info(f"Loading player IDs from player data file: {player_file_path}")
-        with open(player_file_path, 'r') as f_players:
-            player_config = yaml.safe_load(f_players)
+        player_config = _load_yaml(player_file_path)
         roster_data = player_config.get('players', [])
         if not roster_data:
             raise ValueError(f"Player data file {player_file_path} must contain a 'players' list.")
 
-        player_ids = [player['id'] for player in roster_data]
+        # Single pass: collect IDs and stop at the first duplicate (the error now names it)
+        seen_ids = set()
+        player_ids = []
+        for player in roster_data:
+            player_id = player['id']
+            if player_id in seen_ids:
+                raise ValueError(f"Duplicate player ID '{player_id}' found in player data file '{player_file_path}'.")
+            seen_ids.add(player_id)
+            player_ids.append(player_id)
         if len(player_ids) != 9:
             raise ValueError(f"Expected 9 players in player data file '{player_file_path}', found {len(player_ids)}")
-        if len(player_ids) != len(set(player_ids)):
-             raise ValueError(f"Duplicate player IDs found in player data file '{player_file_path}'.")
 
         logger.info(f"Successfully loaded {len(player_ids)} player IDs.")
         return sim_params, orch_params, player_ids
@@ -63,34 +114,341 @@ def load_config_and_players(config_path):
         raise
 
 
-def run_simulation_for_lineup(lineup_perm, num_games, run_output_dir):
-    """Runs main.py for a single lineup and returns the average score."""
+def weakest_hitter_id(config_path):
+    """Returns the ID of the roster's lowest on-base hitter, (H + BB + HBP) / PA."""
+    config_data = _load_yaml(config_path)
+    roster_data = _load_yaml(config_data['player_data_file'])['players']
+
+    def on_base_pct(player):
+        stats = player.get('stats', {})
+        pa = stats.get('plate_appearances', 0)
+        if not pa:
+            return 0.0
+        return (stats.get('hits', 0) + stats.get('walks', 0) + stats.get('hit_by_pitch', 0)) / pa
+
+    return min(roster_data, key=on_base_pct)['id']
+
+
+def lineup_index_permutations(num_players, fixed_first=None, fixed_last=None, start=0, stop=None):
+    """
+    Returns a lazy iterator of batting orders as tuples of roster indices, in
+    lexicographic order of the free slots, limited to positions [start, stop).
+    fixed_first/fixed_last pin one index to slot 1 / slot 9, and the remaining
+    players are permuted around it ((n-1)! orders instead of n!).
+    """
+    rest = [idx for idx in range(num_players) if idx != fixed_first and idx != fixed_last]
+    # Slice the raw C iterator: skipping to a large start then costs ~10 ms for 9!,
+    # instead of running pinning/packing Python code on every skipped lineup
+    perms = itertools.islice(itertools.permutations(rest), start, stop)
+    if fixed_first is None and fixed_last is None:
+        return perms # No per-lineup tuple copies when unpruned
+    head = () if fixed_first is None else (fixed_first,)
+    tail = () if fixed_last is None else (fixed_last,)
+    return (head + perm + tail for perm in perms)
+
+def check_rotation_symmetry(player_ids, num_games, samples):
+    """
+    Sanity check for rotation pruning: simulates all cyclic rotations of `samples`
+    random lineups in-process and logs each spread of average scores next to the
+    Monte Carlo standard error of one lineup's average. A spread well beyond the
+    noise means rotations are not interchangeable for this roster and game count.
+    """
     logger = logging.getLogger("Orchestrator")
-    lineup_str = " ".join(lineup_perm)
-    command = [
-        sys.executable, 'main.py',
-        '--lineup'] + list(lineup_perm) + [
+    if num_games < 2:
+        logger.warning("Rotation check needs at least 2 games per lineup; skipping it.")
+        return
+    simulator = load_simulator(CONFIG_FILE)
+    num_slots = len(player_ids)
+    for sample in range(1, samples + 1):
+        lineup = random.sample(player_ids, num_slots)
+        averages, stderrs = [], []
+        for shift in range(num_slots):
+            simulator.run_simulations(lineup[shift:] + lineup[:shift], verbose=False, num_games_override=num_games)
+            scores = [game['final_score'] for game in simulator.results]
+            averages.append(statistics.fmean(scores))
+            stderrs.append(statistics.stdev(scores) / sqrt(num_games))
+        spread, stderr = max(averages) - min(averages), statistics.fmean(stderrs)
+        # Pure noise gives a range of 9 such averages above 5.35 standard errors ~1 time in 200
+        # (the 99.5th percentile), per sample: with 5 samples a false warning comes ~2.5% of runs
+        level = logging.WARNING if spread > 5.35 * stderr else logging.INFO
+        logger.log(level, "Rotation check %d/%d (%s): average scores span %.3f runs across %d rotations "
+                   "(Monte Carlo standard error %.3f)%s", sample, samples, ' '.join(lineup), spread, num_slots,
+                   stderr, "; rotations do not look interchangeable" if level == logging.WARNING else "")
+
+
+def load_completed_lineups(csv_path, player_ids):
+    """
+    For --resume: returns the set of packed lineups that already have a row in
+    csv_path. A torn last line (from a crash mid-write) is trimmed off the file
+    first, so appended rows start on a fresh line. Unparseable rows are ignored.
+    """
+    with open(csv_path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(max(0, size - 65536))
+            tail = f.read()
+            if not tail.endswith(b"\n"):
+                f.truncate(size - len(tail) + tail.rfind(b"\n") + 1)
+
+    id_to_idx = {player_id: idx for idx, player_id in enumerate(player_ids)}
+    completed = set()
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None) # Header
+        for row in reader:
+            try:
+                float(row[9])
+                completed.add(pack_lineup(map(id_to_idx.__getitem__, row[:9])))
+            except (IndexError, KeyError, ValueError):
+                continue
+    return completed
+
+
+def subprocess_command_suffix(num_games, run_output_dir):
+    """Builds the main.py arguments that follow the lineup; constant for a whole run."""
+    return (
         '--verbose', 'False', # Keep main.py non-verbose for stdout capture
         '--output-dir', run_output_dir, # Pass the specific dir for this run
         '--num-games', str(num_games) # Use specified number of games
-    ]
-    logger.debug(f"Executing command: {' '.join(command)}")
+    )
+
+
+def run_simulation_for_lineup(lineup_perm, command_suffix):
+    """
+    Runs main.py as a separate process for a single lineup and returns the average score.
+    Only used with --subprocess, to isolate each lineup when debugging crashes.
+    command_suffix comes from subprocess_command_suffix().
+    """
+    logger = logging.getLogger("Orchestrator")
+    command = [*SUBPROCESS_CMD_PREFIX, *lineup_perm, *command_suffix]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Executing command: %s", ' '.join(command))
+    # main.py writes the score as 8 raw bytes to the pipe named by SCORE_FD, so stdout
+    # is discarded; stderr is kept as raw bytes and only decoded if something fails
+    score_r, score_w = os.pipe()
     try:
-        process = subprocess.run(command, check=True, capture_output=True, text=True, encoding='utf-8')
-        avg_score_str = process.stdout.strip()
-        avg_score = float(avg_score_str)
-        logger.debug(f"Lineup {lineup_str} -> Avg Score: {avg_score:.4f}")
+        try:
+            process = subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                     pass_fds=(score_w,), env={**os.environ, SCORE_FD_ENV: str(score_w)})
+        finally:
+            os.close(score_w)
+        score_bytes = os.read(score_r, 8)
+        if len(score_bytes) != 8:
+            raise ValueError(f"expected 8 score bytes from main.py, got {len(score_bytes)}")
+        avg_score, = struct.unpack('<d', score_bytes)
         return avg_score
     except subprocess.CalledProcessError as e:
         logger.error(f"!!! Error running main.py for lineup: {lineup_perm} !!!")
         logger.error(f"Return Code: {e.returncode}")
-        logger.error(f"Stdout:\n{e.stdout}")
-        logger.error(f"Stderr:\n{e.stderr}")
+        logger.error(f"Stderr:\n{e.stderr.decode('utf-8', 'replace')}")
         raise # Re-raise the exception to be handled by the caller
-    except ValueError:
-        logger.error(f"Could not convert stdout ('{avg_score_str}') to float for lineup {lineup_perm}.")
-        logger.error(f"Subprocess stderr:\n{process.stderr}")
+    except ValueError as e:
+        logger.error(f"Could not read score for lineup {lineup_perm}: {e}")
+        logger.error(f"Subprocess stderr:\n{process.stderr.decode('utf-8', 'replace')}")
         raise # Re-raise the exception
+    finally:
+        os.close(score_r)
+
+
+def run_daemon_lineups(lineups, player_ids, num_games, cores, run_output_dir):
+    """
+    Generator: simulates packed lineups on `cores` long-lived `main.py --daemon`
+    processes and yields (packed, avg_score) in completion order. A selector
+    watches every daemon's stdout, and each answer is immediately replaced by
+    the next lineup, keeping every daemon DAEMON_PIPELINE_DEPTH lineups ahead.
+    Closing stdin tells a daemon to exit.
+    """
+    logger = logging.getLogger("Orchestrator")
+    command = [CHILD_PYTHON, 'main.py', '--daemon', '--verbose', 'False',
+               '--output-dir', run_output_dir, '--num-games', str(num_games)]
+    logger.debug(f"Starting {cores} daemons: {' '.join(command)}")
+    # Unbuffered binary pipes: stdout is read with os.read, so no answer can sit
+    # unseen in a Python-level buffer while the selector waits on the fd
+    daemons = [subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+               for _ in range(cores)]
+    lineups = iter(lineups)
+    in_flight = {daemon: collections.deque() for daemon in daemons} # Packed lineups, in send order
+    partial = dict.fromkeys(daemons, b"") # Incomplete answer line per daemon
+    selector = selectors.DefaultSelector()
+
+    def submit(daemon):
+        packed = next(lineups, None)
+        if packed is not None:
+            try:
+                daemon.stdin.write((" ".join(unpack_lineup(packed, player_ids)) + "\n").encode())
+            except BrokenPipeError:
+                raise ValueError(f"main.py --daemon exited with code {daemon.wait()} before accepting more lineups")
+            in_flight[daemon].append(packed)
+
+    try:
+        for _ in range(DAEMON_PIPELINE_DEPTH):
+            for daemon in daemons:
+                submit(daemon)
+        for daemon in daemons:
+            if in_flight[daemon]:
+                selector.register(daemon.stdout, selectors.EVENT_READ, daemon)
+
+        while selector.get_map():
+            for key, _ in selector.select():
+                daemon = key.data
+                chunk = os.read(key.fd, 4096)
+                if not chunk:
+                    raise ValueError(f"main.py --daemon exited with code {daemon.wait()} while simulating "
+                                     f"{' '.join(unpack_lineup(in_flight[daemon][0], player_ids))}")
+                lines = (partial[daemon] + chunk).split(b"\n")
+                partial[daemon] = lines.pop()
+                for line in lines:
+                    packed = in_flight[daemon].popleft()
+                    submit(daemon)
+                    yield packed, float(line)
+                if not in_flight[daemon]:
+                    selector.unregister(key.fileobj) # Nothing left to send this daemon
+
+        for daemon in daemons:
+            daemon.stdin.close()
+            if daemon.wait() != 0:
+                raise ValueError(f"main.py --daemon exited with code {daemon.returncode}")
+    except BaseException:
+        for daemon in daemons:
+            daemon.kill()
+        raise
+    finally:
+        selector.close()
+        for daemon in daemons:
+            try:
+                daemon.stdin.close()
+            except OSError:
+                pass # Daemon already gone (killed or crashed)
+            daemon.wait()
+
+
+def init_pinned_worker(worker_counter, *init_args):
+    """
+    Pool initializer for --pin-workers: pins this worker to one of the CPUs the
+    orchestrator may use (chosen by a shared start counter), lowers its priority
+    so the parent writing results isn't starved by its own workers, then runs
+    init_worker.
+    """
+    with worker_counter.get_lock():
+        worker_id = worker_counter.value
+        worker_counter.value += 1
+    if hasattr(os, 'sched_setaffinity'): # Linux only; elsewhere workers float as usual
+        allowed_cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {allowed_cpus[worker_id % len(allowed_cpus)]})
+    if hasattr(os, 'nice'):
+        os.nice(WORKER_NICE_INCREMENT)
+    init_worker(*init_args)
+
+
+def simulate_lineups(lineups, player_ids, num_games, cores, writer, f, run_output_dir, use_subprocess=False, total=None,
+                     max_lineups_per_worker=None, use_daemons=False, pin_workers=False, drop_page_cache=False,
+                     safe_csv=False):
+    """
+    Simulates each lineup and writes one CSV row per lineup as results complete.
+    Lineups are packed ints (src.utils.pack_lineup) indexing into player_ids and
+    are only decoded to ID tuples for logging and the CSV row.
+    By default lineups run in-process on a multiprocessing.Pool (completion order),
+    or directly in this process when only one core is used;
+    with use_subprocess they run one main.py process at a time, in order, and with
+    use_daemons they stream through `cores` persistent main.py --daemon processes.
+    lineups may be any iterable; pass total when it has no len() (e.g. a generator).
+    max_lineups_per_worker, if set, replaces each pool worker after about that many lineups;
+    pin_workers pins each pool worker to its own CPU, and drop_page_cache asks the
+    kernel to evict each flushed batch of CSV rows from the page cache. Rows are
+    formatted directly as text unless safe_csv is set or an ID needs quoting, in
+    which case they go through the csv writer.
+    """
+    logger = logging.getLogger("Orchestrator")
+    if total is None:
+        total = len(lineups)
+
+    # posix_fadvise is POSIX-only (not macOS/Windows); without it the flag is a no-op
+    drop_page_cache = drop_page_cache and hasattr(os, 'posix_fadvise')
+
+    safe_csv = safe_csv or any(ch in player_id for player_id in player_ids for ch in CSV_SPECIAL_CHARS)
+
+    def flush_rows(pending_rows):
+        if safe_csv:
+            writer.writerows(pending_rows)
+        else:
+            f.write("".join(pending_rows))
+        f.flush()
+        if drop_page_cache:
+            os.fdatasync(f.fileno()) # DONTNEED skips dirty pages, so write them back first
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    # Per-lineup log calls use deferred %-style arguments; the DEBUG line is also
+    # guarded, since building its ' '.join argument would otherwise run per lineup
+    def write_results(results):
+        # Batch rows so the file is flushed once per CSV_BATCH_ROWS lineups, not per row
+        pending_rows = []
+        log_each = logger.isEnabledFor(logging.DEBUG)
+        # Bind what the per-lineup loop touches to plain locals (no global/closure/attribute lookups)
+        add_row, decode, ids, row_format = pending_rows.append, unpack_lineup, player_ids, CSV_ROW_FORMAT
+        progress_every, batch_rows, as_tuples = PROGRESS_EVERY, CSV_BATCH_ROWS, safe_csv
+        try:
+            for i, (packed, avg_score) in enumerate(results, 1):
+                lineup = decode(packed, ids)
+                if log_each:
+                    logger.debug("Lineup %d/%d (Games: %d): %s -> Average Score: %.4f",
+                                 i, total, num_games, ' '.join(lineup), avg_score)
+                if as_tuples:
+                    add_row((*lineup, "%.4f" % avg_score)) # One flat tuple per row, as in main.py
+                else:
+                    add_row(row_format % (*lineup, avg_score))
+                if i % batch_rows == 0: # One row per lineup, so this is a full batch
+                    flush_rows(pending_rows)
+                    pending_rows.clear()
+                if i % progress_every == 0:
+                    logger.info("Progress: %d/%d (%.1f%%)", i, total, i * 100 / total)
+        finally:
+            # Keep completed rows even if a simulation fails part way through
+            if pending_rows:
+                flush_rows(pending_rows)
+
+    if use_subprocess:
+        command_suffix = subprocess_command_suffix(num_games, run_output_dir)
+        write_results((packed, run_simulation_for_lineup(unpack_lineup(packed, player_ids), command_suffix))
+                      for packed in lineups)
+        return
+
+    cores = max(1, min(cores, total))
+    if use_daemons:
+        write_results(run_daemon_lineups(lineups, player_ids, num_games, cores, run_output_dir))
+        return
+
+    # Load the Simulator here first; forked workers inherit it instead of reloading
+    init_worker(CONFIG_FILE, num_games, player_ids)
+    if cores == 1:
+        # A single worker gains nothing from a pool: simulate directly in this process
+        write_results(map(run_one_packed, lineups))
+        return
+
+    chunksize = max(1, min(POOL_MAX_CHUNKSIZE, total // (POOL_CHUNKS_PER_WORKER * cores)))
+    # Pool counts tasks (chunks), not lineups, toward maxtasksperchild; a chunk larger
+    # than the limit would run whole, so cap it to keep recycling near every N lineups
+    max_tasks = None
+    if max_lineups_per_worker:
+        chunksize = min(chunksize, max_lineups_per_worker)
+        max_tasks = max(1, max_lineups_per_worker // chunksize)
+    initializer, initargs = init_worker, (CONFIG_FILE, num_games, player_ids)
+    if pin_workers:
+        initializer, initargs = init_pinned_worker, (multiprocessing.Value('i', 0),) + initargs
+    # Forked workers share the parent's loaded Simulator copy-on-write. Freezing the
+    # heap keeps the workers' garbage collector from touching (and so copying) those
+    # pages; spawned workers load their own copy from the config cache instead.
+    gc.freeze()
+    try:
+        with multiprocessing.Pool(processes=cores, initializer=initializer, maxtasksperchild=max_tasks,
+                                  initargs=initargs) as pool:
+            write_results(pool.imap_unordered(run_one_packed, lineups, chunksize=chunksize))
+    finally:
+        gc.unfreeze()
+
+
+def _exit_on_sigterm(signum, frame):
+    """SIGTERM handler: exit through SystemExit so finally blocks flush buffered CSV rows."""
+    sys.exit(128 + signum)
 
 
 def main():
@@ -102,13 +460,35 @@ def main():
     # New --rerun argument: Takes 2 integer values
     parser.add_argument('--rerun', type=int, nargs=2, metavar=('TOP_N', 'NUM_GAMES'), default=None,
                         help='Manually trigger a rerun for the TOP_N lineups using NUM_GAMES simulations each. Overrides config auto_rerun settings.')
+    parser.add_argument('--cores', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes used to simulate lineups in parallel (default: all CPUs).')
+    parser.add_argument('--max-lineups-per-worker', type=int, default=None, metavar='N',
+                        help='Replace each pool worker process after roughly N lineups to bound memory growth (default: never; ignored with --cores 1, --subprocess and --daemon).')
+    parser.add_argument('--resume', type=str, default=None, metavar='RUN_DIR',
+                        help='Continue an interrupted run in RUN_DIR (e.g. results/20250101_120000): lineups already in its initial CSV are skipped and new rows are appended.')
+    parser.add_argument('--pin-workers', action='store_true',
+                        help='Pin each pool worker to its own CPU (Linux only; ignored elsewhere).')
+    parser.add_argument('--drop-csv-cache', action='store_true',
+                        help='Evict written result rows from the OS page cache after each batch (POSIX only; ignored elsewhere).')
+    parser.add_argument('--safe-csv', action='store_true',
+                        help='Write result rows through the csv module instead of the direct text fast path (used automatically if a player ID needs quoting).')
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument('--subprocess', action='store_true',
+                            help='Run each lineup in its own main.py process, one at a time (slow; isolates crashes for debugging).')
+    mode_group.add_argument('--daemon', action='store_true',
+                            help='Stream lineups through --cores long-lived "main.py --daemon" processes instead of the in-process pool.')
 
     args = parser.parse_args()
+    # Ctrl-C already unwinds via KeyboardInterrupt; make `kill` do the same instead of dropping rows
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
     # Setup logging
     log_level = logging.DEBUG if args.debug else logging.INFO
     setup_logging(level=log_level)
     logger = logging.getLogger("Orchestrator")
+    # Keep the simulation modules as quiet as the old main.py subprocesses were
+    logging.getLogger("src").setLevel(logging.WARNING)
+    logging.getLogger("main").setLevel(logging.WARNING)
 
     logger.info("Starting Lineup Permutation Simulation Orchestrator...")
     logger.debug(f"Orchestrator Args: {args}")
@@ -124,15 +504,22 @@ def main():
     initial_num_games = args.num_games if args.num_games is not None else sim_params.get('num_games', 162)
     logger.info(f"Initial simulation run will use {initial_num_games} games per lineup.")
 
-    # --- Create Timestamped Output Directory ---
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_output_dir = os.path.join(RESULTS_BASE_DIR, timestamp)
-    try:
-        os.makedirs(run_output_dir, exist_ok=True)
-        logger.info(f"Created results directory: {run_output_dir}")
-    except OSError as e:
-        logger.error(f"Failed to create results directory {run_output_dir}: {e}")
-        sys.exit(1)
+    # --- Create Timestamped Output Directory (or reuse the one being resumed) ---
+    if args.resume:
+        run_output_dir = args.resume
+        if not os.path.isdir(run_output_dir):
+            logger.error(f"Cannot resume: results directory {run_output_dir} does not exist.")
+            sys.exit(1)
+        logger.info(f"Resuming run in results directory: {run_output_dir}")
+    else:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_output_dir = os.path.join(RESULTS_BASE_DIR, timestamp)
+        try:
+            os.makedirs(run_output_dir, exist_ok=True)
+            logger.info(f"Created results directory: {run_output_dir}")
+        except OSError as e:
+            logger.error(f"Failed to create results directory {run_output_dir}: {e}")
+            sys.exit(1)
 
     # --- Initial Permutation Simulation ---
     initial_csv_filename = f"{initial_num_games}_game_results.csv"
@@ -140,8 +527,26 @@ def main():
     logger.info(f"Initial results CSV will be saved to: {initial_csv_path}")
 
     logger.info("Generating lineup permutations for initial run...")
-    all_permutations_generator = itertools.permutations(player_ids)
-    total_possible_perms = factorial(len(player_ids))
+    pruning = orch_params.get('pruning') or {}
+    fixed_first = fixed_last = None
+    if pruning.get('fix_cleanup', False):
+        cleanup_id = weakest_hitter_id(CONFIG_FILE)
+        fixed_last = player_ids.index(cleanup_id)
+        logger.info(f"Pruning: fixing weakest on-base hitter {cleanup_id} in the 9th slot.")
+        if pruning.get('dedup_rotations', False):
+            # Each rotation class already has exactly one member with the cleanup hitter 9th
+            logger.info("Pruning: dedup_rotations is implied by fix_cleanup; ignoring it.")
+    elif pruning.get('dedup_rotations', False):
+        # The rotation starting with roster index 0 is the lexicographically smallest one,
+        # so pinning that player to slot 1 keeps exactly one lineup per cyclic rotation class
+        fixed_first = 0
+        logger.info(f"Pruning: keeping one lineup per cyclic rotation ({player_ids[0]} leads off).")
+
+    rotation_samples = pruning.get('rotation_check_samples', 0)
+    if rotation_samples and (fixed_first is not None or fixed_last is not None):
+        check_rotation_symmetry(player_ids, initial_num_games, rotation_samples)
+
+    total_possible_perms = factorial(len(player_ids) - (fixed_first is not None or fixed_last is not None))
     logger.info(f"Total possible permutations: {total_possible_perms}")
 
     start_index = args.start
@@ -154,32 +559,51 @@ def main():
          logger.error(f"Invalid stop index {stop_index}. Must be > start ({start_index}) and <= {total_possible_perms}.")
          sys.exit(1)
 
-    permutations_to_run = list(itertools.islice(all_permutations_generator, start_index, stop_index))
-    num_permutations_in_slice = len(permutations_to_run)
+    # Stream the slice rather than materializing up to 362,880 tuples up front. Roster
+    # indices permute in the same order as the IDs; each lineup is packed into one int.
+    def slice_lineups():
+        return map(pack_lineup, lineup_index_permutations(len(player_ids), fixed_first, fixed_last,
+                                                          start_index, stop_index))
+    permutations_to_run = slice_lineups()
+    num_permutations_in_slice = stop_index - start_index
     logger.info(f"Selected permutations from index {start_index} to {stop_index} (exclusive). Total to simulate: {num_permutations_in_slice}")
 
+    # --resume: skip lineups that already have a row and append to the existing CSV
+    resuming = args.resume and os.path.isfile(initial_csv_path) and os.path.getsize(initial_csv_path) > 0
+    write_header = not resuming
+    if resuming:
+        try:
+            completed = load_completed_lineups(initial_csv_path, player_ids)
+            # Trimming a torn header (no complete line) leaves the file empty: start it over
+            write_header = os.path.getsize(initial_csv_path) == 0
+        except (OSError, csv.Error) as e:
+            logger.error(f"Cannot resume from {initial_csv_path}: {e}")
+            sys.exit(1)
+        permutations_to_run = (packed for packed in permutations_to_run if packed not in completed)
+        # One cheap extra pass over the slice gives an exact count for progress logging
+        num_permutations_in_slice = sum(1 for packed in slice_lineups() if packed not in completed)
+        logger.info(f"Resume: {len(completed)} lineups already in '{initial_csv_path}'; {num_permutations_in_slice} left to simulate in this slice.")
+
     initial_run_successful = False
     try:
-        with open(initial_csv_path, 'w', newline='') as f:
+        with open(initial_csv_path, 'a' if resuming else 'w', newline='', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
-            header = [f"P{i+1}_ID" for i in range(9)] + ["AverageScore"]
-            writer.writerow(header)
-            logger.info(f"Initialized CSV '{initial_csv_path}' with header.")
-
-            for i, lineup_perm in enumerate(permutations_to_run):
-                absolute_index = start_index + i
-                logger.info(f"\n--- Running Initial Sim {i+1}/{num_permutations_in_slice} (Abs Index: {absolute_index}, Games: {initial_num_games}) ---")
-                logger.info(f"Lineup: {' '.join(lineup_perm)}")
-
-                try:
-                    avg_score = run_simulation_for_lineup(lineup_perm, initial_num_games, run_output_dir)
-                    logger.info(f"Simulation successful. Average Score: {avg_score:.4f}")
-                    row = list(lineup_perm) + [f"{avg_score:.4f}"]
-                    writer.writerow(row)
-                    f.flush()
-                except (subprocess.CalledProcessError, ValueError):
-                    logger.error(f"Failed simulation for lineup {lineup_perm}. Stopping orchestrator.")
-                    sys.exit(1) # Stop if any simulation fails
+            if write_header:
+                header = [f"P{i+1}_ID" for i in range(9)] + ["AverageScore"]
+                writer.writerow(header)
+                logger.info(f"Initialized CSV '{initial_csv_path}' with header.")
+
+            logger.info(f"\n--- Running Initial Sims for {num_permutations_in_slice} lineups (Abs Index: {start_index}-{stop_index - 1}, Games: {initial_num_games}, Cores: {args.cores}) ---")
+            try:
+                simulate_lineups(permutations_to_run, player_ids, initial_num_games, args.cores, writer, f,
+                                 run_output_dir, use_subprocess=args.subprocess,
+                                 total=num_permutations_in_slice,
+                                 max_lineups_per_worker=args.max_lineups_per_worker,
+                                 use_daemons=args.daemon, pin_workers=args.pin_workers,
+                                 drop_page_cache=args.drop_csv_cache, safe_csv=args.safe_csv)
+            except (subprocess.CalledProcessError, ValueError) as e:
+                logger.error(f"Failed initial simulation: {e}. Stopping orchestrator.")
+                sys.exit(1) # Stop if any simulation fails
 
             logger.info(f"\n--- Initial Simulation Run Complete ---")
             logger.info(f"Results summary saved to '{initial_csv_path}'")
@@ -228,38 +652,39 @@ def main():
         try:
             # Read the initial results CSV
             logger.info(f"Reading initial results from: {initial_csv_path}")
-            df = pd.read_csv(initial_csv_path)
-
-            # Sort by AverageScore (descending) and get top N lineups
-            top_lineups_df = df.sort_values(by='AverageScore', ascending=False).head(rerun_top_n)
-            logger.info(f"Identified Top {len(top_lineups_df)} lineups for rerun:")
-            for idx, row in top_lineups_df.iterrows():
-                 lineup_ids = tuple(row[f'P{i+1}_ID'] for i in range(9))
-                 logger.debug(f"  Rank {idx+1}: {lineup_ids} (Score: {row['AverageScore']:.4f})")
-
-
-            # Run simulations for the top lineups
-            with open(rerun_csv_path, 'w', newline='') as f_rerun:
+            with open(initial_csv_path, 'r', newline='') as f_initial:
+                reader = csv.reader(f_initial)
+                header = next(reader, None)
+                if not header:
+                    raise EOFError
+                score_col = header.index('AverageScore') # ValueError if the column is missing
+                # Single pass keeping only the top N rows (O(N log K)) instead of sorting them all
+                top_rows = heapq.nlargest(rerun_top_n, reader, key=lambda row: float(row[score_col]))
+            logger.info(f"Identified Top {len(top_rows)} lineups for rerun:")
+            if logger.isEnabledFor(logging.DEBUG):
+                for rank, row in enumerate(top_rows, 1):
+                     logger.debug(f"  Rank {rank}: {tuple(row[:9])} (Score: {row[score_col]})")
+
+
+            # Run simulations for the top lineups; the heap's rows are packed directly, one dict lookup per slot
+            id_to_idx = {player_id: idx for idx, player_id in enumerate(player_ids)}
+            rerun_lineups = [pack_lineup(map(id_to_idx.__getitem__, row[:9])) for row in top_rows]
+            with open(rerun_csv_path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as f_rerun:
                 writer_rerun = csv.writer(f_rerun)
                 header = [f"P{i+1}_ID" for i in range(9)] + ["AverageScore"]
                 writer_rerun.writerow(header)
                 logger.info(f"Initialized Rerun CSV '{rerun_csv_path}' with header.")
 
-                for i, (index, row) in enumerate(top_lineups_df.iterrows()):
-                    lineup_perm = tuple(row[f'P{j+1}_ID'] for j in range(9)) # Extract lineup tuple
-                    logger.info(f"\n--- Running Rerun Sim {i+1}/{len(top_lineups_df)} (Games: {rerun_num_games}) ---")
-                    logger.info(f"Lineup: {' '.join(lineup_perm)}")
-
-                    try:
-                        avg_score = run_simulation_for_lineup(lineup_perm, rerun_num_games, run_output_dir)
-                        logger.info(f"Rerun simulation successful. Average Score: {avg_score:.4f}")
-                        result_row = list(lineup_perm) + [f"{avg_score:.4f}"]
-                        writer_rerun.writerow(result_row)
-                        f_rerun.flush()
-                    except (subprocess.CalledProcessError, ValueError):
-                        logger.error(f"Failed rerun simulation for lineup {lineup_perm}. Stopping orchestrator.")
-                        # Optionally, decide if one failure should stop the whole rerun
-                        sys.exit(1) # Stop if any rerun simulation fails
+                logger.info(f"\n--- Running Rerun Sims for {len(rerun_lineups)} lineups (Games: {rerun_num_games}) ---")
+                try:
+                    simulate_lineups(rerun_lineups, player_ids, rerun_num_games, args.cores, writer_rerun, f_rerun,
+                                     run_output_dir, use_subprocess=args.subprocess,
+                                     max_lineups_per_worker=args.max_lineups_per_worker,
+                                     use_daemons=args.daemon, pin_workers=args.pin_workers,
+                                     drop_page_cache=args.drop_csv_cache, safe_csv=args.safe_csv)
+                except (subprocess.CalledProcessError, ValueError) as e:
+                    logger.error(f"Failed rerun simulation: {e}. Stopping orchestrator.")
+                    sys.exit(1) # Stop if any rerun simulation fails
 
             logger.info(f"\n--- Rerun Phase Complete ---")
             logger.info(f"Rerun results saved to '{rerun_csv_path}'")
@@ -267,11 +692,11 @@ def main():
         except FileNotFoundError:
             logger.error(f"Initial results file not found at {initial_csv_path}. Cannot perform rerun.")
             sys.exit(1)
-        except pd.errors.EmptyDataError:
+        except EOFError:
              logger.error(f"Initial results file {initial_csv_path} is empty. Cannot perform rerun.")
              sys.exit(1)
-        except KeyError as e:
-             logger.error(f"Missing expected column in {initial_csv_path} (e.g., 'AverageScore' or 'P*_ID'): {e}. Cannot perform rerun.")
+        except (ValueError, IndexError, KeyError) as e:
+             logger.error(f"Malformed initial results file {initial_csv_path} (expected roster 'P*_ID' values and an 'AverageScore' column): {e}. Cannot perform rerun.")
              sys.exit(1)
         except IOError as e:
             logger.error(f"Failed to write to rerun CSV file {rerun_csv_path}: {e}")
@@ -1,17 +1,22 @@
 # src/constants.py
 
 # Plate Appearance Outcomes
-WALK = "WALK"
-HIT_BY_PITCH = "HBP"
-STRIKEOUT = "SO"
-SINGLE = "1B"
-DOUBLE = "2B"
-TRIPLE = "3B"
-HOME_RUN = "HR"
-GROUND_OUT = "GO" # New
-FLY_OUT = "FO"    # New
+# Small ints, so the engine compares and indexes them cheaply; hits are contiguous
+# (SINGLE <= outcome <= HOME_RUN) and walks/HBP come first (outcome <= HIT_BY_PITCH).
+# OUTCOME_NAMES gives the label used in logs.
+WALK = 0
+HIT_BY_PITCH = 1
+STRIKEOUT = 2
+SINGLE = 3
+DOUBLE = 4
+TRIPLE = 5
+HOME_RUN = 6
+GROUND_OUT = 7 # New
+FLY_OUT = 8    # New
 # OUT_IN_PLAY = "OUT" # Removed
 
+OUTCOME_NAMES = ("WALK", "HBP", "SO", "1B", "2B", "3B", "HR", "GO", "FO") # Indexed by outcome
+
 # List of possible outcomes for weighted random choice
 OUTCOMES = [
     WALK,
@@ -2,6 +2,9 @@
 
 import logging
 import math # For checking isnan
+from array import array # Unboxed per-outcome probabilities
+from bisect import bisect
+from itertools import accumulate # Cumulative outcome weights for bisect sampling
 from .constants import *
 
 logger = logging.getLogger(__name__)
@@ -9,11 +12,14 @@ logger = logging.getLogger(__name__)
 class Player:
     """Represents a player with their stats and calculated probabilities."""
 
+    __slots__ = ('id', 'name', 'raw_stats', 'probabilities', 'extra_base_percentage', 'gb_fb_ratio',
+                 'outcome_list', 'probability_weights', '_outcomes_tuple', '_cum_bounds', '_cum_total')
+
     def __init__(self, player_id, name, stats):
         self.id = player_id
         self.name = name
         self.raw_stats = stats
-        self.probabilities = {}
+        self.probabilities = array('d', [0.0]) * len(OUTCOMES) # C doubles indexed by outcome code
         self.extra_base_percentage = stats.get('extra_base_percentage', 0.0)
         self.gb_fb_ratio = stats.get('gb_fb_ratio', 1.0) # Default to 1 if missing
 
@@ -28,10 +34,9 @@ class Player:
         pa = self.raw_stats['plate_appearances']
         if pa <= 0:
             logger.warning(f"Player {self.name} has {pa} Plate Appearances. Setting all probabilities to 0.")
-            for outcome in OUTCOMES:
-                self.probabilities[outcome] = 0.0
-            self.outcome_list = list(self.probabilities.keys())
-            self.probability_weights = list(self.probabilities.values())
+            self.outcome_list = list(OUTCOMES)
+            self.probability_weights = list(self.probabilities) # All 0.0
+            self._build_sampling_table()
             return
 
         # Calculate derived stats
@@ -58,7 +63,7 @@ class Player:
         self.probabilities[HOME_RUN] = home_runs / pa
 
         # Calculate probability of *any* out on a ball in play
-        prob_reached_base_or_so = sum(self.probabilities.values())
+        prob_reached_base_or_so = sum(self.probabilities) # GO/FO still 0.0
         prob_out_in_play = max(0.0, 1.0 - prob_reached_base_or_so) # Ensure non-negative
 
         # Distribute prob_out_in_play between GO and FO based on GB/FB ratio
@@ -77,42 +82,88 @@ class Player:
 
 
         # --- Final check and potential normalization ---
-        # Ensure all defined outcomes have a probability
-        for outcome in OUTCOMES:
-             if outcome not in self.probabilities:
-                 self.probabilities[outcome] = 0.0
-             # Handle potential NaN from division by zero if pa was 0 but sliped through
-             if math.isnan(self.probabilities[outcome]):
-                 self.probabilities[outcome] = 0.0
-
-
-        total_prob = sum(self.probabilities.values())
-        if abs(total_prob - 1.0) > 0.01 and pa > 0: # Allow minor float inaccuracies if PA > 0
-             logger.warning(f"Probabilities for {self.name} sum to {total_prob:.4f}, not 1.0. Normalizing.")
-             # Normalize
-             if total_prob > 0:
-                 factor = 1.0 / total_prob
-                 for outcome in self.probabilities:
-                     self.probabilities[outcome] *= factor
-             else: # If total_prob is 0 (e.g., PA=0), ensure all are 0
-                 for outcome in self.probabilities:
+        # With outs left to split, GO + FO take exactly what the other outcomes leave, so
+        # the sum is 1.0 up to rounding: only a clamped (or NaN) out share needs the check.
+        if prob_out_in_play <= 0 or not math.isfinite(gb_weight):
+            # Every outcome has a slot (0.0 unless set above)
+            for outcome in OUTCOMES:
+                 # Handle potential NaN from division by zero if pa was 0 but sliped through
+                 if math.isnan(self.probabilities[outcome]):
                      self.probabilities[outcome] = 0.0
-             # Ensure the largest probability takes any remaining difference due to float issues
-             if pa > 0:
-                 diff = 1.0 - sum(self.probabilities.values())
-                 max_prob_outcome = max(self.probabilities, key=self.probabilities.get)
-                 self.probabilities[max_prob_outcome] += diff
+
+
+            total_prob = sum(self.probabilities)
+            if abs(total_prob - 1.0) > 0.01 and pa > 0: # Allow minor float inaccuracies if PA > 0
+                 logger.warning(f"Probabilities for {self.name} sum to {total_prob:.4f}, not 1.0. Normalizing.")
+                 # Normalize
+                 if total_prob > 0:
+                     factor = 1.0 / total_prob
+                     for outcome in OUTCOMES:
+                         self.probabilities[outcome] *= factor
+                 else: # If total_prob is 0 (e.g., PA=0), ensure all are 0
+                     for outcome in OUTCOMES:
+                         self.probabilities[outcome] = 0.0
+                 # Ensure the largest probability takes any remaining difference due to float issues
+                 if pa > 0:
+                     diff = 1.0 - sum(self.probabilities)
+                     # Outcome codes are the array's indices: first largest, as max() with a key picks
+                     max_prob_outcome = self.probabilities.index(max(self.probabilities))
+                     self.probabilities[max_prob_outcome] += diff
 
 
         # Prepare lists for random.choices
-        self.outcome_list = list(self.probabilities.keys())
-        self.probability_weights = list(self.probabilities.values())
+        self.outcome_list = list(OUTCOMES)
+        self.probability_weights = list(self.probabilities)
+        self._build_sampling_table()
+
+    def _build_sampling_table(self):
+        """
+        Precomputes what random.choices would rebuild on every call: the cumulative
+        weights, their total and the outcomes as a tuple (see Game.simulate_plate_appearance).
+        Only the first n-1 cumulative weights are kept as bounds: random.choices bisects
+        with hi=n-1, so a plain bisect over the bounds picks the same index.
+        A player with no probability mass always strikes out without drawing, as the
+        original engine did: empty bounds mark that case, so the random sequence of
+        later draws is the same as before (the other eight outcomes never leave them empty).
+        Built once per player when the roster loads (and kept in the Simulator's config
+        cache); every game and forked worker reads these same immutable tuples.
+        """
+        cum_weights = list(accumulate(self.probability_weights))
+        total = cum_weights[-1] + 0.0 if cum_weights else 0.0
+        if total <= 0:
+            logger.warning(f"Player {self.name} has zero total probability weight. Every PA will be a {OUTCOME_NAMES[STRIKEOUT]}.")
+            self._outcomes_tuple = (STRIKEOUT,)
+            self._cum_bounds = ()
+            self._cum_total = 1.0
+        else:
+            self._outcomes_tuple = tuple(self.outcome_list)
+            self._cum_bounds = tuple(cum_weights[:-1])
+            self._cum_total = total
+
+    def sample_outcome(self, rand):
+        """
+        Draws one PA outcome using rand, a random.random-style callable (a single draw,
+        or none for a zero-weight player, who strikes out).
+        Inverse-CDF lookup on the precomputed cumulative weights; with only nine outcomes
+        one C-level bisect beats an alias table's extra indexing and comparison in Python.
+        """
+        bounds = self._cum_bounds
+        return self._outcomes_tuple[bisect(bounds, rand() * self._cum_total)] if bounds else STRIKEOUT
 
     def get_probabilities(self):
-        return self.probabilities
-
-    def get_outcome_weights(self):
-        """Returns outcomes and their corresponding weights for random.choices."""
+        """Returns {outcome: probability}; built on demand from the per-outcome array."""
+        return dict(zip(OUTCOMES, self.probabilities))
+
+    def get_outcome_weights(self, cumulative=False):
+        """
+        Returns outcomes and their corresponding weights for random.choices. With
+        cumulative=True, returns the precomputed (outcomes, cum_weights) the engine
+        samples from, for random.choices(outcomes, cum_weights=cum_weights) without
+        re-accumulating the weights on every call. For a zero-weight player that is
+        ((STRIKEOUT,), (1.0,)), though the engine itself strikes them out without a draw.
+        """
+        if cumulative:
+            return self._outcomes_tuple, self._cum_bounds + (self._cum_total,)
         return self.outcome_list, self.probability_weights
 
     def __str__(self):
